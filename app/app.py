@@ -1,28 +1,36 @@
 # === IMPORTS AND ENVIRONMENT SETUP ===
 
+from __future__ import annotations
+
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Ensure src/ is in the path for module resolution
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Ensure src/ is in the path for module resolution (only once; the script reruns on every interaction)
+_PROJECT_ROOT = str(Path(__file__).absolute().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 import os
-import base64
-import pandas as pd
-import deepl
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import streamlit as st
-from transformers import pipeline
-import psutil
-import requests
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Heavy ML/API libraries are imported inside the functions that use them,
+# so the first page render does not wait for torch/transformers to load
+if TYPE_CHECKING:
+    import deepl
+    import onnxruntime as ort
+    import pandas as pd
+    import torch
 
 from texts import TEXTS
 from components.render_emotion import render_emotion_block
 from components.render_theme import render_theme_block
 from components.render_feedback import render_feedback_section
-from src.interface.recommender import load_entire_corpus, recommend_verses_by_sections
-from src.utils.save_feedback_to_gsheet import save_feedback_to_gsheet
-from src.utils.translation_maps import BOOK_NAME_MAP_ES
+from src.interface.recommender import load_entire_corpus, load_section_pools, sample_verses_by_sections
 from src.utils.translation_maps import GO_EMOTIONS_TO_EKMAN
 
 # Load environment variables
@@ -33,7 +41,10 @@ st.set_page_config(page_title="Lingua Animae", page_icon="📖")
 
 # === LOGGER SETUP ===
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
 LOG_DIR = Path(__file__).parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
@@ -42,290 +53,318 @@ LOG_FILE = LOG_DIR / "app.log"
 def setup_logger(log_path: Path, level: int = logging.INFO, log_name: str = "app_logger") -> logging.Logger:
     """
     Set up a logger for the Streamlit app.
+
+    Records are pushed to a queue and written to the file by a background
+    QueueListener thread, so logging calls never block on disk I/O.
     """
     logger = logging.getLogger(log_name)
     logger.setLevel(level)
     if not logger.handlers:
         fh = logging.FileHandler(log_path, encoding="utf-8")
         fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-        logger.addHandler(fh)
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, fh, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
     return logger
 
 logger = setup_logger(LOG_FILE)
 
+# Memory logging is opt-in (LINGUA_DEBUG_MEM=1) to keep it off the request path
+_MEM_DEBUG = os.environ.get("LINGUA_DEBUG_MEM") == "1"
+
 def log_memory_usage(tag: str = "") -> None:
     """
-    Log the current memory usage (in MB) with an optional tag for context.
+    Log the process's peak memory usage so far (in MB) with an optional tag for context.
+    Does nothing unless the LINGUA_DEBUG_MEM environment variable is set to "1",
+    or where the `resource` module is unavailable (Windows).
+
+    The value is the high-water mark (ru_maxrss), not current usage: it never goes
+    down between tags, so it is not a per-stage measurement.
 
     Args:
         tag (str, optional): Custom label for the log/context.
     """
-    import psutil
-    import os
-    process = psutil.Process(os.getpid())
-    mem_mb = process.memory_info().rss / 1024 ** 2
-    logger.info(f"🔍 [{tag}] Memory usage: {mem_mb:.2f} MB")
+    if not _MEM_DEBUG:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    mem_mb = max_rss / 1024 ** 2 if sys.platform == "darwin" else max_rss / 1024
+    logger.info(f"🔍 [{tag}] Peak memory usage so far (process high-water mark): {mem_mb:.2f} MB")
 
 # === VISUAL AND UI UTILITIES ===
 
-def get_base64_bg(image_path: str) -> str:
-    """
-    Encode an image in base64 to be used as background.
-
-    Args:
-        image_path (str): Path to the image file.
-
-    Returns:
-        str: Base64-encoded string.
-    """
-    with open(image_path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-def set_background(image_path: str) -> None:
-    """
-    Set a background image for the app and apply global CSS styling.
-
-    Args:
-        image_path (str): Path to the image file.
-    """
-    try:
-        bg_base64 = get_base64_bg(image_path)
-        st.markdown(f"""
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@400;600;700;800;900&family=Merriweather:wght@300;400&display=swap');
-
-            html, body, .stApp, [class^="css"], [class*="st-"] {{
-                font-family: 'Cormorant Garamond', serif !important;
-                font-size: 18px;
-                color: #5d4037;
-                background-color: transparent;
-                text-shadow: 1px 1px 1px rgba(0,0,0,0.1);
-            }}
-
-            .stApp {{
-                background-image: url("data:image/jpg;base64,{bg_base64}");
-                background-size: cover;
-                background-attachment: fixed;
-                background-position: center;
-            }}
-
-            h1, h2, h3 {{
-                color: #5d4037;
-                text-shadow: 0 1px 1px #ffffffaa;
-            }}
-
-            .stApp > header, .stApp [data-testid="stHeader"], .block-container {{
-                margin-top: 0 !important;
-                padding-top: 0 !important;
-            }}
-            .block-container {{
-                margin-top: 0 !important;
-                padding-top: 1rem !important;
-            }}
-
-            .stTextInput > div > div > input {{
-                background-color: #fdf6e3cc;
-                border: 1px solid #5d4037;
-                border-radius: 10px;
-                padding: 0.6rem;
-                color: #4e342e;
-                transition: all 0.3s ease;
-            }}
-
-            header[data-testid="stHeader"] {{
-                display: none;
-            }}
-
-            span[data-testid="stFormSubmitHelper"] {{
-                display: none !important;
-            }}
-
-            div[data-testid="InputInstructions"] {{
-                display: none !important;
-            }}
-
-        </style>
-        """, unsafe_allow_html=True)
-    except FileNotFoundError:
-        logger.error(f"Background image not found at {image_path}.")
-        st.warning("⚠️ Background image not found. Please check the path.")
+# Static CSS is assembled once at import time and emitted in a single st.markdown call
+_BASE_CSS = """
+    @import url('https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@400;600;700;800;900&family=Merriweather:wght@300;400&display=swap');
+
+    html, body, .stApp, [class^="css"], [class*="st-"] {
+        font-family: 'Cormorant Garamond', serif !important;
+        font-size: 18px;
+        color: #5d4037;
+        background-color: transparent;
+        text-shadow: 1px 1px 1px rgba(0,0,0,0.1);
+    }
+
+    /* Served from app/static/ (enableStaticServing) so the browser caches it */
+    .stApp {
+        background-image: url("app/static/old-wrinkled-paper.jpg");
+        background-size: cover;
+        background-attachment: fixed;
+        background-position: center;
+    }
+
+    h1, h2, h3 {
+        color: #5d4037;
+        text-shadow: 0 1px 1px #ffffffaa;
+    }
+
+    .stApp > header, .stApp [data-testid="stHeader"], .block-container {
+        margin-top: 0 !important;
+        padding-top: 0 !important;
+    }
+    .block-container {
+        margin-top: 0 !important;
+        padding-top: 1rem !important;
+    }
+
+    .stTextInput > div > div > input {
+        background-color: #fdf6e3cc;
+        border: 1px solid #5d4037;
+        border-radius: 10px;
+        padding: 0.6rem;
+        color: #4e342e;
+        transition: all 0.3s ease;
+    }
+
+    header[data-testid="stHeader"] {
+        display: none;
+    }
+
+    span[data-testid="stFormSubmitHelper"] {
+        display: none !important;
+    }
+
+    div[data-testid="InputInstructions"] {
+        display: none !important;
+    }
+"""
+
+_CUSTOM_CSS = """
+            
+    div[data-testid="stSpinner"], .stSpinner {
+        display: none !important;
+    }
+            
+    div[data-testid="column"] div:nth-child(1) button {
+        background-color: #fbe9e7;
+        border: 1px solid #5d4037;
+        color: #2e7d32;
+        font-weight: 600;
+        border-radius: 10px;
+    }
+
+    div[data-testid="column"] div:nth-child(1) + div button {
+        background-color: #fbe9e7;
+        border: 1px solid #5d4037;
+        color: #c62828;
+        font-weight: 600;
+        border-radius: 10px;
+    }
+            
+    button:hover {
+        opacity: 0.85;
+    }
+
+    button[kind="secondary"] {
+        background-color: #fdf6e3cc;
+        border: 1px solid #5d4037;
+        border-radius: 12px;
+        padding: 0.6rem 1rem;
+        font-size: 1.1rem;
+        font-weight: 500;
+        color: #4e342e;
+        box-shadow: 2px 2px 6px rgba(0,0,0,0.1);
+        transition: all 0.2s ease-in-out;
+    }
+
+    button[kind="secondary"]:hover {
+        transform: scale(1.05);
+        background-color: #fbe9e7;
+    }
+
+    button[data-testid="stBaseButton-secondary"] {
+        background-color: #f3e5d1;
+        border: 1px solid #5d4037;
+        border-radius: 12px;
+        font-size: 1.05rem;
+        font-weight: 500;
+        color: #4e342e;
+        text-decoration: none;
+        box-shadow: 2px 2px 6px rgba(0,0,0,0.6);
+        transition: all 0.25s ease-in-out;
+        padding: 0.75rem 1.5rem;
+    }
+
+    button[data-testid="stBaseButton-secondary"]:hover {
+        background-color: #fff1c9;
+        transform: scale(1.05);
+        box-shadow: 3px 3px 8px rgba(0,0,0,0.2);
+    }
+            
+    button[data-testid="stBaseButton-secondaryFormSubmit"] {
+        font-family: 'Cormorant Garamond', serif !important;
+        background-color: #f3e5d1;
+        border: 1px solid #5d4037;
+        border-radius: 12px;
+        padding: 0.75rem 1.5rem;
+        font-size: 1.2rem;
+        font-weight: 800 !important;
+        color: #4e342e;
+        box-shadow: 2px 2px 12px rgba(0,0,0,0.6);
+        display: block;
+        margin: 1rem auto 0 auto;
+        transition: all 0.2s ease-in-out;
+    }
+            
+    button[data-testid="stBaseButton-secondaryFormSubmit"] p {
+        font-family: 'Cormorant Garamond', serif !important;
+        font-weight: 800 !important;
+    }
+
+    button[data-testid="stBaseButton-secondaryFormSubmit"]:hover {
+        background-color: #fff1c9;
+        transform: scale(1.05);
+    }
+            
+    div[data-testid="stForm"] {
+        background-color: #f3e5d1;
+        border: 1px solid #5d4037; 
+        border-radius: 16px;
+        padding: 2rem 2.5rem;
+        margin-top: 1rem;
+        box-shadow: 2px 2px 12px rgba(0, 0, 0, 0.6);
+    }
+            
+    div[data-testid="stRadio"] label {
+        background: none !important;
+        border: none !important;
+        font-size: 1.6rem;
+        transition: transform 0.25s ease, filter 0.25s ease;
+        cursor: pointer;
+        transform-origin: center;
+    }
+
+    div[data-testid="stRadio"] label:hover {
+        transform: scale(1.3);
+        filter: brightness(1.3);
+    }
+
+    div[data-testid="stRadio"] input[type="radio"]:checked + div p {
+        transform: scale(1.3);
+        text-decoration: underline;
+    }
+
+    div[data-testid="stRadio"] {
+        display: flex !important;
+        justify-content: flex-end;
+    }
+            
+    .custom-spinner-box {
+        max-width: 400px;
+        margin: 2rem auto;
+        padding: 1rem 1.5rem;
+        background-color: rgba(243, 229, 209, 0.85);
+        border: 1px solid #5d4037;
+        border-radius: 12px;
+        box-shadow: 2px 2px 6px rgba(0, 0, 0, 0.15);
+        text-align: center;
+        font-family: 'Merriweather', serif;
+        font-size: 1.05rem;
+        color: #4e342e;
+    }
+
+    .custom-spinner-box p::after {
+        content: ' ⏳';
+        animation: pulseDots 1.2s infinite;
+    }
+
+    @keyframes pulseDots {
+        0%   { opacity: 0.2; }
+        50%  { opacity: 1; }
+        100% { opacity: 0.2; }
+    }
+            
+    /* Style for the feedback link inside a centered Markdown block */
+    div[data-testid="stMarkdownContainer"] div[style*="text-align: center"] > a.feedback-button {
+        display: inline-block;
+        background-color: #f3e5d1;
+        border: 1px solid #5d4037;
+        border-radius: 12px;
+        padding: 0.6rem 1.2rem;
+        font-size: 1rem;
+        font-weight: 500;
+        font-family: 'Merriweather', serif;
+        color: #4e342e;
+        text-decoration: none;
+        box-shadow: 2px 2px 6px rgba(0, 0, 0, 0.1);
+        transition: all 0.25s ease-in-out;
+        cursor: pointer;
+        margin-top: 1rem;
+    }
+
+    /* Hover */
+    div[data-testid="stMarkdownContainer"] div[style*="text-align: center"] > a.feedback-button:hover {
+        background-color: #fff1c9;
+        transform: scale(1.03);
+        box-shadow: 3px 3px 8px rgba(0, 0, 0, 0.2);
+    }
+"""
+
+_FOOTER_CSS = """
+    .custom-footer {
+        position: fixed;
+        bottom: 0;
+        width: 28%;
+        background-color: rgba(243, 229, 209, 0.85);
+        color: #4e342e;
+        text-align: center;
+        font-size: 1rem;
+        padding: 0.6rem 1rem;
+        font-family: 'Merriweather', serif;
+        border-top: 1px solid #5d4037;
+        border-radius: 10px 10px 0 0;
+        box-shadow: 0px -2px 12px rgba(0, 0, 0, 0.5);
+        z-index: 9999;
+    }
+    .custom-footer a {
+        color: #6d4c41;
+        text-decoration: none;
+        font-weight: 500;
+        display: inline-block;
+        position: relative; 
+        transition: all 0.25s ease
+    }
+            
+    .custom-footer a:hover {
+        transform: scale(1.05);
+        filter: drop-shadow(0 0 4px rgba(255,255,255,0.4)) brightness(1.2);
+        text-shadow: 0 0 2px rgba(255, 255, 255, 0.2);
+    }
+"""
+
+_STATIC_CSS = "<style>" + _BASE_CSS + _CUSTOM_CSS + _FOOTER_CSS + "</style>"
 
 def inject_custom_styles() -> None:
     """
-    Inject additional custom CSS styles for UI elements.
-    """
-    st.markdown("""
-    <style>
-                
-        div[data-testid="stSpinner"], .stSpinner {
-            display: none !important;
-        }
-                
-        div[data-testid="column"] div:nth-child(1) button {
-            background-color: #fbe9e7;
-            border: 1px solid #5d4037;
-            color: #2e7d32;
-            font-weight: 600;
-            border-radius: 10px;
-        }
-
-        div[data-testid="column"] div:nth-child(1) + div button {
-            background-color: #fbe9e7;
-            border: 1px solid #5d4037;
-            color: #c62828;
-            font-weight: 600;
-            border-radius: 10px;
-        }
-                
-        button:hover {
-            opacity: 0.85;
-        }
-
-        button[kind="secondary"] {
-            background-color: #fdf6e3cc;
-            border: 1px solid #5d4037;
-            border-radius: 12px;
-            padding: 0.6rem 1rem;
-            font-size: 1.1rem;
-            font-weight: 500;
-            color: #4e342e;
-            box-shadow: 2px 2px 6px rgba(0,0,0,0.1);
-            transition: all 0.2s ease-in-out;
-        }
-
-        button[kind="secondary"]:hover {
-            transform: scale(1.05);
-            background-color: #fbe9e7;
-        }
-
-        button[data-testid="stBaseButton-secondary"] {
-            background-color: #f3e5d1;
-            border: 1px solid #5d4037;
-            border-radius: 12px;
-            font-size: 1.05rem;
-            font-weight: 500;
-            color: #4e342e;
-            text-decoration: none;
-            box-shadow: 2px 2px 6px rgba(0,0,0,0.6);
-            transition: all 0.25s ease-in-out;
-            padding: 0.75rem 1.5rem;
-        }
-
-        button[data-testid="stBaseButton-secondary"]:hover {
-            background-color: #fff1c9;
-            transform: scale(1.05);
-            box-shadow: 3px 3px 8px rgba(0,0,0,0.2);
-        }
-                
-        button[data-testid="stBaseButton-secondaryFormSubmit"] {
-            font-family: 'Cormorant Garamond', serif !important;
-            background-color: #f3e5d1;
-            border: 1px solid #5d4037;
-            border-radius: 12px;
-            padding: 0.75rem 1.5rem;
-            font-size: 1.2rem;
-            font-weight: 800 !important;
-            color: #4e342e;
-            box-shadow: 2px 2px 12px rgba(0,0,0,0.6);
-            display: block;
-            margin: 1rem auto 0 auto;
-            transition: all 0.2s ease-in-out;
-        }
-                
-        button[data-testid="stBaseButton-secondaryFormSubmit"] p {
-            font-family: 'Cormorant Garamond', serif !important;
-            font-weight: 800 !important;
-        }
-
-        button[data-testid="stBaseButton-secondaryFormSubmit"]:hover {
-            background-color: #fff1c9;
-            transform: scale(1.05);
-        }
-                
-        div[data-testid="stForm"] {
-            background-color: #f3e5d1;
-            border: 1px solid #5d4037; 
-            border-radius: 16px;
-            padding: 2rem 2.5rem;
-            margin-top: 1rem;
-            box-shadow: 2px 2px 12px rgba(0, 0, 0, 0.6);
-        }
-                
-        div[data-testid="stRadio"] label {
-            background: none !important;
-            border: none !important;
-            font-size: 1.6rem;
-            transition: transform 0.25s ease, filter 0.25s ease;
-            cursor: pointer;
-            transform-origin: center;
-        }
-
-        div[data-testid="stRadio"] label:hover {
-            transform: scale(1.3);
-            filter: brightness(1.3);
-        }
-
-        div[data-testid="stRadio"] input[type="radio"]:checked + div p {
-            transform: scale(1.3);
-            text-decoration: underline;
-        }
-
-        div[data-testid="stRadio"] {
-            display: flex !important;
-            justify-content: flex-end;
-        }
-                
-        .custom-spinner-box {
-            max-width: 400px;
-            margin: 2rem auto;
-            padding: 1rem 1.5rem;
-            background-color: rgba(243, 229, 209, 0.85);
-            border: 1px solid #5d4037;
-            border-radius: 12px;
-            box-shadow: 2px 2px 6px rgba(0, 0, 0, 0.15);
-            text-align: center;
-            font-family: 'Merriweather', serif;
-            font-size: 1.05rem;
-            color: #4e342e;
-        }
-
-        .custom-spinner-box p::after {
-            content: ' ⏳';
-            animation: pulseDots 1.2s infinite;
-        }
-
-        @keyframes pulseDots {
-            0%   { opacity: 0.2; }
-            50%  { opacity: 1; }
-            100% { opacity: 0.2; }
-        }
-                
-        /* Style for the feedback link inside a centered Markdown block */
-        div[data-testid="stMarkdownContainer"] div[style*="text-align: center"] > a.feedback-button {
-            display: inline-block;
-            background-color: #f3e5d1;
-            border: 1px solid #5d4037;
-            border-radius: 12px;
-            padding: 0.6rem 1.2rem;
-            font-size: 1rem;
-            font-weight: 500;
-            font-family: 'Merriweather', serif;
-            color: #4e342e;
-            text-decoration: none;
-            box-shadow: 2px 2px 6px rgba(0, 0, 0, 0.1);
-            transition: all 0.25s ease-in-out;
-            cursor: pointer;
-            margin-top: 1rem;
-        }
-
-        /* Hover */
-        div[data-testid="stMarkdownContainer"] div[style*="text-align: center"] > a.feedback-button:hover {
-            background-color: #fff1c9;
-            transform: scale(1.03);
-            box-shadow: 3px 3px 8px rgba(0, 0, 0, 0.2);
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    Inject the global (background included), button, and footer CSS styles in a single call.
+    """
+    st.markdown(_STATIC_CSS, unsafe_allow_html=True)
 
 # === MODEL, TRANSLATION, AND ANALYSIS FUNCTIONS ===
 
@@ -341,71 +380,417 @@ def get_deepl_key():
         logger.warning("DEEPL_API_KEY not set in secrets or environment.")
         raise ValueError("DEEPL_API_KEY not set!")
 
+@st.cache_resource(show_spinner=False)
+def get_translator() -> deepl.Translator:
+    """
+    Build the DeepL client once per process so its HTTP session is reused.
+    """
+    import deepl
+
+    return deepl.Translator(get_deepl_key())
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_translation(text: str) -> str:
+    """
+    Cached DeepL call; exceptions propagate so failed translations are never cached.
+    """
+    return get_translator().translate_text(text, target_lang="EN-US").text
+
+# Pre-exported INT8 ONNX build of Helsinki-NLP/opus-mt-es-en, used when DeepL is unavailable
+LOCAL_TRANSLATION_MODEL_NAME = "Xenova/opus-mt-es-en"
+
+@st.cache_resource(show_spinner=False)
+def load_local_translator() -> tuple:
+    """
+    Load the tokenizer and quantized MarianMT es→en model served with ONNX Runtime.
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(LOCAL_TRANSLATION_MODEL_NAME)
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        LOCAL_TRANSLATION_MODEL_NAME,
+        encoder_file_name="onnx/encoder_model_quantized.onnx",
+        decoder_file_name="onnx/decoder_model_quantized.onnx",
+        decoder_with_past_file_name="onnx/decoder_with_past_model_quantized.onnx",
+        provider="CPUExecutionProvider",
+        session_options=_ort_session_options()
+    )
+    return tokenizer, model
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_local_translation(text: str) -> str:
+    """
+    Cached offline es→en translation with the local MarianMT model.
+    """
+    import torch
+
+    tokenizer, model = load_local_translator()
+    inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
+    with torch.inference_mode():
+        output_ids = model.generate(**inputs, max_new_tokens=512)
+    return tokenizer.decode(output_ids[0], skip_special_tokens=True)
+
 def translate_to_english(text: str) -> str:
     """
     Translate input text to English using DeepL API.
+    Falls back to a local MarianMT model if DeepL is not configured or the request fails.
     """
     try:
-        api_key = get_deepl_key()
-        translator = deepl.Translator(api_key)
-        result = translator.translate_text(text, target_lang="EN-US")
+        translated = _cached_translation(text)
         logger.info("Text translated to English.")
-        return result.text
+        return translated
     except Exception as e:
         logger.error(f"DeepL translation failed: {e}")
-        st.error(f"❌ DeepL translation failed: {e}")
+
+    try:
+        translated = _cached_local_translation(text)
+        logger.info("Text translated to English with the local model.")
+        return translated
+    except Exception as e:
+        logger.error(f"Local translation failed: {e}")
+        st.error(f"❌ Translation failed: {e}")
         return text
 
-@st.cache_resource
-def load_emotion_model():
+EMOTION_MODEL_NAME = "SamLowe/roberta-base-go_emotions"
+# Pre-exported INT8 (dynamically quantized) ONNX build of the same emotion model
+EMOTION_ONNX_MODEL_NAME = "SamLowe/roberta-base-go_emotions-onnx"
+EMOTION_ONNX_FILE = "onnx/model_quantized.onnx"
+THEME_MODEL_NAME = "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli"
+# No INT8 build is published for the theme model, so it is exported and quantized locally once
+THEME_ONNX_DIR = Path(__file__).parent / "models" / "theme-onnx-int8"
+THEME_ONNX_FILE = "model_quantized.onnx"
+MAX_TOKENS = 128
+# Inputs are short prompts; longer text is cut before it reaches DeepL or the models
+MAX_INPUT_CHARS = 1024
+
+# Candidate themes are fixed, so the NLI hypotheses are built once at import time
+THEMES_EN = ("Love", "Faith", "Hope", "Forgiveness", "Fear")
+THEMES_ES = ("Amor", "Fe", "Esperanza", "Perdón", "Miedo")
+THEME_EN_TO_ES = dict(zip(THEMES_EN, THEMES_ES))
+THEME_HYPOTHESES = [f"This example is {theme}." for theme in THEMES_EN]
+
+def _infer(model_bundle: tuple, text, text_pair=None) -> torch.Tensor:
     """
-    Load the emotion classifier pipeline from HuggingFace (SamLowe GoEmotions).
+    Tokenize the input once and run a single forward pass without autograd.
+
+    Args:
+        model_bundle (tuple): (tokenizer, model) pair returned by a model loader.
+        text (str | list[str]): Input text(s).
+        text_pair (list[str], optional): Second sequences for pair classification.
+
+    Returns:
+        torch.Tensor: Raw logits with shape (batch, num_labels).
     """
-    return pipeline(
-        "text-classification",
-        model="SamLowe/roberta-base-go_emotions",
-        top_k=None
+    import torch
+
+    tokenizer, model = model_bundle
+    inputs = tokenizer(
+        text,
+        text_pair,
+        return_tensors="pt",
+        padding=True,
+        truncation="only_first" if text_pair is not None else True,
+        max_length=MAX_TOKENS
     )
+    with torch.inference_mode():
+        return model(**inputs).logits
+
+def _ort_session_options() -> ort.SessionOptions:
+    """
+    Build ONNX Runtime session options with full graph optimizations enabled.
+    The emotion and theme sessions run concurrently, so each gets half of the
+    CPUs available to this process instead of all of them.
+    """
+    import onnxruntime as ort
+
+    try:
+        n_cpus = len(os.sched_getaffinity(0))  # honours CPU affinity
+    except AttributeError:
+        n_cpus = os.cpu_count() or 1
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = max(1, n_cpus // 2)
+    options.inter_op_num_threads = 1
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return options
+
+@st.cache_resource(show_spinner=False)
+def load_emotion_model() -> tuple:
+    """
+    Load the tokenizer and the INT8 ONNX emotion classifier (SamLowe GoEmotions).
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(EMOTION_MODEL_NAME)
+    model = ORTModelForSequenceClassification.from_pretrained(
+        EMOTION_ONNX_MODEL_NAME,
+        file_name=EMOTION_ONNX_FILE,
+        provider="CPUExecutionProvider",
+        session_options=_ort_session_options()
+    )
+    return tokenizer, model
 
 def classify_ekman_emotion(text, emotion_model):
     """
     Classify the Ekman emotion using the SamLowe GoEmotions model and the mapping.
     """
-    preds = emotion_model(text)[0]
-    top_pred = max(preds, key=lambda x: x["score"])
-    go_label = top_pred["label"]
+    import torch
+
+    # GoEmotions is multi-label, so scores are per-label sigmoids (as in the HF pipeline)
+    scores = torch.sigmoid(_infer(emotion_model, text)[0])
+    top_idx = int(scores.argmax())
+    go_label = emotion_model[1].config.id2label[top_idx]
     ekman_label = GO_EMOTIONS_TO_EKMAN.get(go_label, "neutral")
     logger.info(f"Emotion classified: {ekman_label} (GoEmotion: {go_label})")
-    return {"ekman_label": ekman_label, "go_label": go_label, "score": top_pred["score"]}
+    return {"ekman_label": ekman_label, "go_label": go_label, "score": float(scores[top_idx])}
 
-@st.cache_resource
-def load_theme_model():
+def _export_quantized_theme_model() -> None:
+    """
+    Export the NLI model to ONNX and apply dynamic INT8 quantization, saving the result to THEME_ONNX_DIR.
+    Runs once; later processes load the quantized file straight from disk.
     """
-    Load the zero-shot classifier for theme detection.
+    import shutil
+    import tempfile
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    logger.info("Exporting and quantizing theme model to ONNX (first run only).")
+    THEME_ONNX_DIR.parent.mkdir(parents=True, exist_ok=True)
+    # Build in a sibling temp dir and move it into place, so an interrupted export is never picked up
+    tmp_dir = Path(tempfile.mkdtemp(dir=THEME_ONNX_DIR.parent))
+    try:
+        model = ORTModelForSequenceClassification.from_pretrained(THEME_MODEL_NAME, export=True)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=tmp_dir, quantization_config=qconfig)
+        shutil.rmtree(THEME_ONNX_DIR, ignore_errors=True)
+        tmp_dir.rename(THEME_ONNX_DIR)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    logger.info(f"Quantized theme model saved to {THEME_ONNX_DIR}.")
+
+@st.cache_resource(show_spinner=False)
+def load_theme_model() -> tuple:
+    """
+    Load the tokenizer and NLI model used for zero-shot theme detection,
+    served from the locally quantized ONNX export with ONNX Runtime.
     """
-    return pipeline(
-        "zero-shot-classification",
-        model="MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli"
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer
+
+    if not (THEME_ONNX_DIR / THEME_ONNX_FILE).exists():
+        _export_quantized_theme_model()
+
+    tokenizer = AutoTokenizer.from_pretrained(THEME_MODEL_NAME)
+    model = ORTModelForSequenceClassification.from_pretrained(
+        THEME_ONNX_DIR,
+        file_name=THEME_ONNX_FILE,
+        provider="CPUExecutionProvider",
+        session_options=_ort_session_options()
     )
+    return tokenizer, model
+
+def _entailment_id(config) -> int:
+    """
+    Return the index of the entailment class in an NLI model config.
+    """
+    for label, idx in config.label2id.items():
+        if label.lower().startswith("entail"):
+            return idx
+    return -1
+
+@st.cache_resource(show_spinner=False)
+def _theme_hypothesis_ids() -> list[list[int]]:
+    """
+    Token ids (without special tokens) of the fixed NLI hypotheses, computed once per process.
+    """
+    tokenizer = load_theme_model()[0]
+    return tokenizer(THEME_HYPOTHESES, add_special_tokens=False)["input_ids"]
+
+def _encode_theme_pairs(tokenizer, text: str) -> dict:
+    """
+    Build the (premise, hypothesis) batch for zero-shot theme detection.
+    The premise is tokenized once and joined with each cached hypothesis; like
+    truncation="only_first", only the premise is cut to fit MAX_TOKENS.
+
+    Returns:
+        dict: Padded model inputs as PyTorch tensors, one row per candidate theme.
+    """
+    premise_ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+    n_special = tokenizer.num_special_tokens_to_add(pair=True)
+    features = []
+    for hyp_ids in _theme_hypothesis_ids():
+        prem_ids = premise_ids[:MAX_TOKENS - n_special - len(hyp_ids)]
+        feature = {"input_ids": tokenizer.build_inputs_with_special_tokens(prem_ids, hyp_ids)}
+        if "token_type_ids" in tokenizer.model_input_names:
+            feature["token_type_ids"] = tokenizer.create_token_type_ids_from_sequences(prem_ids, hyp_ids)
+        features.append(feature)
+    return tokenizer.pad(features, return_tensors="pt")
 
 def get_top_theme(text: str, lang: str) -> dict:
     """
     Detect the top theme from a given text and return it in the appropriate language.
+    All candidate themes are scored in one batched forward pass over pre-tokenized hypotheses.
     """
-    classifier = load_theme_model()
+    import torch
+
+    theme_model = load_theme_model()
     log_memory_usage("After loading theme model")
-    themes_en = ["Love", "Faith", "Hope", "Forgiveness", "Fear"]
-    themes_es = ["Amor", "Fe", "Esperanza", "Perdón", "Miedo"]
-    result = classifier(text, candidate_labels=themes_en)
-    label = result["labels"][0]
-    score = result["scores"][0]
+    tokenizer, model = theme_model
+    inputs = _encode_theme_pairs(tokenizer, text)
+    with torch.inference_mode():
+        logits = model(**inputs).logits
+    # Single-label zero-shot: softmax over the entailment logits of all candidates
+    scores = torch.softmax(logits[:, _entailment_id(theme_model[1].config)], dim=0)
+    top_idx = int(scores.argmax())
+    label = THEMES_EN[top_idx]
+    score = float(scores[top_idx])
     if lang == "es":
-        label = dict(zip(themes_en, themes_es)).get(label, label)
+        label = THEME_EN_TO_ES.get(label, label)
     logger.info(f"Theme classified: {label}")
     return {"label": label, "score": score}
 
+def normalize_text(text: str) -> str:
+    """
+    Collapse whitespace so trivially different inputs share a cache entry.
+    Casing is preserved because both models are case-sensitive.
+    """
+    return " ".join(text.split())
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_emotion(norm_text: str) -> dict:
+    """
+    Memoized emotion classification keyed on the normalized English text.
+    """
+    return classify_ekman_emotion(norm_text, load_emotion_model())
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_theme(norm_text: str, lang: str) -> dict:
+    """
+    Memoized theme detection keyed on the normalized English text and language.
+    """
+    return get_top_theme(norm_text, lang=lang)
+
+def _warm_caches() -> None:
+    """
+    Load both models and both verse corpora so the first analysis skips the cold start.
+    One throwaway forward pass per model also pre-allocates the ONNX Runtime memory arenas.
+    """
+    try:
+        _infer(load_emotion_model(), "warm up")
+        theme_tokenizer, theme_model = load_theme_model()
+        theme_model(**_encode_theme_pairs(theme_tokenizer, "warm up"))
+        for lang in ("en", "es"):
+            load_entire_corpus(lang=lang)
+        logger.info("Model and corpus caches warmed.")
+    except Exception as e:
+        logger.error(f"Cache warm-up failed: {e}")
+
+@st.cache_resource(show_spinner=False)
+def _start_cache_warmup() -> threading.Thread:
+    """
+    Start the warm-up in a daemon thread once per process; reruns hit the cached handle.
+    Concurrent requests for a model still being loaded wait on Streamlit's per-key cache lock.
+    """
+    thread = threading.Thread(target=_warm_caches, name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
+
 # === RENDERING, INPUT, AND FEEDBACK ===
 
+# Static header/label HTML, built once per language at import time
+_LANG_LABEL_HTML = {
+    lang: f"""
+    <div style='text-align: right; width: 100%;'>
+        <p style="font-weight: 600; font-size: 1rem; font-family: 'Cormorant Garamond', serif; margin-bottom: 0.3rem;">
+            {T["language_label"]}
+        </p>
+    </div>
+    """
+    for lang, T in TEXTS.items()
+}
+
+_TITLE_HTML = """<h1 style='font-family: Cormorant Garamond, serif; font-size: 2rem; font-weight: 600;
+color: #5d4037; text-align: center; margin-top: -1.5rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.2);'>
+📖 Lingua Animae 📖</h1>"""
+
+_SUBTITLE_HTML = {
+    lang: f"<p style='font-family: Merriweather, serif; font-size: 1rem; line-height: 1.6; font-weight: 300; text-shadow: 0.5px 0.5px 1px rgba(0,0,0,0.15); text-align: center; margin-top: 0.5rem;'>"
+    f"{T['subtitle']}</p>"
+    for lang, T in TEXTS.items()
+}
+
+_MENTAL_HEALTH_NOTE_HTML = {
+    lang: f"<p style='font-family: Merriweather, serif; font-size: 0.65rem; opacity: 0.7; text-align: center; margin-top: -0.5rem;'>"
+    f"{T['mental_health_note']}</p>"
+    for lang, T in TEXTS.items()
+}
+
+_NAME_LABEL_HTML = {
+    lang: f"<p style='font-size: 1.1rem; font-weight: 500; margin-top: 1rem;'>💬 {T['name_label']}</p>"
+    for lang, T in TEXTS.items()
+}
+
+_INPUT_LABEL_HTML = {
+    lang: f"<p style='font-size: 1.1rem; font-weight: 500; margin-top: 1rem;'>{T['input_label']}</p>"
+    for lang, T in TEXTS.items()
+}
+
+_SPINNER_HTML = {
+    lang: f"""
+        <div class="custom-spinner-box">
+            <p>{T["analyzing"]}</p>
+        </div>
+        """
+    for lang, T in TEXTS.items()
+}
+
+_SEPARATOR_HTML = """
+            <div style='text-align: center; margin-top: 2.5rem; margin-bottom: 0.5rem;'>
+                <span style='font-size: 1.5rem;'>✶</span>
+            </div>
+            <hr style='border: none; border-top: 1.2px solid #5d4037; margin: 0 auto 1.5rem auto; width: 60%;'>
+        """
+
+_RECOMMENDED_HEADING_HTML = {
+    lang: f"<h3 style='color: #4e342e;'>📖 {T['recommended_verses']}:</h3>"
+    for lang, T in TEXTS.items()
+}
+
+_VERSE_CARD_TMPL = """
+                <div style='margin-bottom: 1.2rem; padding: 1rem; border-left: 4px solid #5d4037;
+                            background-color: #fefefeaa; border-radius: 8px;
+                            box-shadow: 0 1px 3px rgba(0,0,0,0.6);'>
+                    <p style='font-size: 1.05rem; line-height: 1.6; margin-bottom: 0.5rem;'>{text}</p>
+                    <p style='font-size: 0.9rem; color: #6d4c41; font-style: italic;'>({reference})</p>
+                </div>
+                """
+
+_NO_MATCHES_HTML = {
+    lang: f"<p style='color: #6d4c41; font-style: italic;'>{T['no_matches']}</p>"
+    for lang, T in TEXTS.items()
+}
+
+FEEDBACK_FORM_URL = "https://forms.gle/ATXVWXTaoCDR19rf9"
+
+_FEEDBACK_FORM_HTML = {
+    lang: f"""
+            <div style='text-align: center; margin-top: 2.5rem;'>
+                <p style='font-size: 1.15rem;'>{T["feedback_form_label"]}</p>
+                <a href="{FEEDBACK_FORM_URL}" target="_blank" class="feedback-button">{T["feedback_form_button"]}</a>
+            </div>
+            """
+    for lang, T in TEXTS.items()
+}
+
+_FOOTER_HTML = """
+        <div class="custom-footer">
+            Hecho con ❤️ por Manuel Cruz Rodríguez · <a href="https://www.linkedin.com/in/mancrurod/" target="_blank">🌐 LinkedIn</a>
+        </div>
+        """
+
 def render_language_selector() -> tuple[str, dict]:
     """
     Render a custom language selector in the sidebar and return the selected language code
@@ -420,17 +805,10 @@ def render_language_selector() -> tuple[str, dict]:
     stored_key = st.session_state.get("lang_selector", "ES")
     default_lang_key = stored_key if stored_key in lang_options else "ES"
     default_lang_code = lang_options[default_lang_key]
-    T = TEXTS[default_lang_code]
 
     try:
         with st.container():
-            st.markdown(f"""
-            <div style='text-align: right; width: 100%;'>
-                <p style="font-weight: 600; font-size: 1rem; font-family: 'Cormorant Garamond', serif; margin-bottom: 0.3rem;">
-                    {T["language_label"]}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_LANG_LABEL_HTML[default_lang_code], unsafe_allow_html=True)
 
             selected_key = st.radio(
                 "Language selector",
@@ -448,12 +826,12 @@ def render_language_selector() -> tuple[str, dict]:
         # Fallback to English in case of error
         return "en", TEXTS["en"]
 
-def render_user_inputs(T: dict) -> tuple[str, str]:
+def render_user_inputs(lang: str) -> tuple[str, str]:
     """
     Render the main title, subtitle, mental health note, and input fields for user name and user text.
 
     Args:
-        T (dict): Translation dictionary for the selected language.
+        lang (str): Selected language code, used to pick the prebuilt HTML blocks.
 
     Returns:
         tuple[str, str]: User name and user input text.
@@ -461,34 +839,20 @@ def render_user_inputs(T: dict) -> tuple[str, str]:
     try:
         with st.container():
             # Title
-            st.markdown("""<h1 style='font-family: Cormorant Garamond, serif; font-size: 2rem; font-weight: 600;
-            color: #5d4037; text-align: center; margin-top: -1.5rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.2);'>
-            📖 Lingua Animae 📖</h1>""", unsafe_allow_html=True)
+            st.markdown(_TITLE_HTML, unsafe_allow_html=True)
 
             # Subtitle
-            st.markdown(
-                f"<p style='font-family: Merriweather, serif; font-size: 1rem; line-height: 1.6; font-weight: 300; text-shadow: 0.5px 0.5px 1px rgba(0,0,0,0.15); text-align: center; margin-top: 0.5rem;'>"
-                f"{T['subtitle']}</p>", unsafe_allow_html=True
-            )
+            st.markdown(_SUBTITLE_HTML[lang], unsafe_allow_html=True)
 
             # Mental health note
-            st.markdown(
-                f"<p style='font-family: Merriweather, serif; font-size: 0.65rem; opacity: 0.7; text-align: center; margin-top: -0.5rem;'>"
-                f"{T['mental_health_note']}</p>", unsafe_allow_html=True
-            )
+            st.markdown(_MENTAL_HEALTH_NOTE_HTML[lang], unsafe_allow_html=True)
 
             # Input: user name
-            st.markdown(
-                f"<p style='font-size: 1.1rem; font-weight: 500; margin-top: 1rem;'>💬 {T['name_label']}</p>",
-                unsafe_allow_html=True
-            )
+            st.markdown(_NAME_LABEL_HTML[lang], unsafe_allow_html=True)
             usuario = st.text_input("Nombre", key="nombre_usuario", label_visibility="collapsed")
 
             # Input: user text
-            st.markdown(
-                f"<p style='font-size: 1.1rem; font-weight: 500; margin-top: 1rem;'>{T['input_label']}</p>",
-                unsafe_allow_html=True
-            )
+            st.markdown(_INPUT_LABEL_HTML[lang], unsafe_allow_html=True)
             user_input = st.text_input("Texto", key="user_input", label_visibility="collapsed")
 
         logger.info("Rendered user inputs section successfully.")
@@ -510,9 +874,7 @@ def validate_user_input(text: str, lang: str) -> bool:
         bool: True if input is valid, False otherwise. Shows a warning if invalid.
     """
     if text and len(text.strip()) < 3:
-        warning_msg = "⚠️ Por favor, escribe un poco más de contexto." if lang == "es" \
-                      else "⚠️ Please write a bit more context."
-        st.warning(warning_msg)
+        st.warning(TEXTS[lang]["warn_short"])
         logger.warning(f"Input too short for validation (lang={lang}).")
         return False
     logger.info(f"User input validated successfully (length={len(text.strip()) if text else 0}).")
@@ -537,68 +899,73 @@ def analyze_user_input(text: str, lang: str) -> tuple[dict, dict, str, pd.DataFr
     try:
         spinner_placeholder = st.empty()  # create a temporary container
 
-        spinner_placeholder.markdown(f"""
-        <div class="custom-spinner-box">
-            <p>{'Analizando...' if lang == 'es' else 'Analyzing...'}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        spinner_placeholder.markdown(_SPINNER_HTML[lang], unsafe_allow_html=True)
 
         logger.info("Starting analysis pipeline for user input.")
 
-        # Translation
-        translated = translate_to_english(text)
-        logger.info("Translation to English completed.")
-
-        # Emotion classification
-        try:
-            emotion_model = load_emotion_model()
-            log_memory_usage("After loading emotion model")
-            emotion_result = classify_ekman_emotion(translated, emotion_model)
-            top_emotion = {
-                "label": emotion_result["ekman_label"],   # Ekman emotion
-                "go_label": emotion_result["go_label"],   # (Optional, original label)
-                "score": emotion_result["score"]
-            }
-            logger.info(f"Emotion detected: {top_emotion['label']} (score={top_emotion['score']:.3f})")
-        except Exception as e:
-            logger.error(f"Emotion analysis failed: {e}")
-            st.error("❌ No se pudo analizar la emoción del texto." if lang == "es"
-                     else "❌ Failed to analyze emotion from text.")
-            st.stop()
-
-        # Theme classification
-        try:
-            theme_result = get_top_theme(translated, lang=lang)
-            logger.info(f"Theme detected: {theme_result['label']} (score={theme_result['score']:.3f})")
-        except Exception as e:
-            logger.error(f"Theme detection failed: {e}")
-            st.error("❌ No se pudo detectar el tema principal." if lang == "es"
-                     else "❌ Failed to detect the main theme.")
-            st.stop()
-
-        # Load verse corpus
-        df_verses = load_entire_corpus(lang=lang)
+        if len(text) > MAX_INPUT_CHARS:
+            logger.info(f"User input truncated from {len(text)} to {MAX_INPUT_CHARS} characters.")
+            text = text[:MAX_INPUT_CHARS]
+
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+            # The corpus load is independent of the input, so it overlaps translation and inference
+            corpus_future = executor.submit(load_entire_corpus, lang=lang)
+
+            # Translation (the models are English-only; English input skips the DeepL round-trip)
+            if lang == "en":
+                translated = text
+            else:
+                translated = translate_to_english(text)
+                logger.info("Translation to English completed.")
+
+            # Emotion and theme classification share no state, so both models run concurrently
+            norm_text = normalize_text(translated)
+            emotion_future = executor.submit(_cached_emotion, norm_text)
+            theme_future = executor.submit(_cached_theme, norm_text, lang)
+
+            # Emotion classification
+            try:
+                emotion_result = emotion_future.result()
+                log_memory_usage("After emotion classification")
+                top_emotion = {
+                    "label": emotion_result["ekman_label"],   # Ekman emotion
+                    "go_label": emotion_result["go_label"],   # (Optional, original label)
+                    "score": emotion_result["score"]
+                }
+                logger.info(f"Emotion detected: {top_emotion['label']} (score={top_emotion['score']:.3f})")
+            except Exception as e:
+                logger.error(f"Emotion analysis failed: {e}")
+                st.error(TEXTS[lang]["err_emotion"])
+                st.stop()
+
+            # Theme classification
+            try:
+                theme_result = theme_future.result()
+                logger.info(f"Theme detected: {theme_result['label']} (score={theme_result['score']:.3f})")
+            except Exception as e:
+                logger.error(f"Theme detection failed: {e}")
+                st.error(TEXTS[lang]["err_theme"])
+                st.stop()
+
+            # Load verse corpus
+            df_verses = corpus_future.result()
         log_memory_usage("After loading corpus")
         if df_verses.empty:
             logger.warning("Verse corpus is empty.")
-            st.warning("⚠️ No se pudo cargar el corpus de versículos." if lang == "es"
-                       else "⚠️ Verse corpus could not be loaded.")
+            st.warning(TEXTS[lang]["err_corpus"])
             st.stop()
 
-        # Generate recommendations
-        recommendations = recommend_verses_by_sections(
-            df_verses,
-            top_emotion["label"],
-            theme_result["label"],
-            lang=lang
+        # Generate recommendations (section pools are cached per label combination)
+        recommendations = sample_verses_by_sections(
+            load_section_pools(lang, top_emotion["label"], theme_result["label"])
         )
         logger.info("Verse recommendations generated successfully.")
         log_memory_usage("After generating recommendations")
 
     except Exception as e:
         logger.error(f"Unexpected error during analysis: {e}")
-        st.error("❌ Ha ocurrido un error inesperado durante el análisis." if lang == "es"
-                 else "❌ An unexpected error occurred during analysis.")
+        st.error(TEXTS[lang]["err_unexpected"])
         st.stop()
 
     # Remove the spinner box once finished
@@ -631,12 +998,7 @@ def render_analysis_results(
         lang (str): Selected language code.
     """
     try:
-        st.markdown("""
-            <div style='text-align: center; margin-top: 2.5rem; margin-bottom: 0.5rem;'>
-                <span style='font-size: 1.5rem;'>✶</span>
-            </div>
-            <hr style='border: none; border-top: 1.2px solid #5d4037; margin: 0 auto 1.5rem auto; width: 60%;'>
-        """, unsafe_allow_html=True)
+        st.markdown(_SEPARATOR_HTML, unsafe_allow_html=True)
 
         st.markdown(T["detected"], unsafe_allow_html=True)
         render_emotion_block(st, emotion["label"], emotion["score"], lang=lang)
@@ -646,50 +1008,40 @@ def render_analysis_results(
         render_theme_block(st, theme["label"], theme["score"], lang=lang)
         logger.info(f"Rendered detected theme: {theme['label']} ({theme['score']:.3f})")
 
-        st.markdown(
-            f"<p style='font-size: 0.75rem; color: #4e342e; text-shadow: 0.5px 0.5px 1px rgba(0,0,0,0.2); margin-top: 1rem; text-align: center; opacity: 0.7;'>"
-            f"{T['translated_as']} <i>{translated}</i></p>",
-            unsafe_allow_html=True
-        )
-        logger.info("Rendered translated input.")
-
-        if not recommendations.empty:
+        # English input is not translated, so there is nothing to show
+        if lang != "en":
             st.markdown(
-                f"<h3 style='color: #4e342e;'>📖 {'Versículos recomendados' if lang == 'es' else 'Recommended verses'}:</h3>",
+                f"<p style='font-size: 0.75rem; color: #4e342e; text-shadow: 0.5px 0.5px 1px rgba(0,0,0,0.2); margin-top: 1rem; text-align: center; opacity: 0.7;'>"
+                f"{T['translated_as']} <i>{translated}</i></p>",
                 unsafe_allow_html=True
             )
-            for _, row in recommendations.iterrows():
-                # Normalize book name (especially for Spanish)
-                book_raw = row["book"].lower().replace("_", "-")
-                book_display = (
-                    BOOK_NAME_MAP_ES.get(book_raw, book_raw.title())
-                    if lang == "es"
-                    else book_raw.replace("-", " ").title()
-                )
-                st.markdown(
-                    f"""
-                    <div style='margin-bottom: 1.2rem; padding: 1rem; border-left: 4px solid #5d4037;
-                                background-color: #fefefeaa; border-radius: 8px;
-                                box-shadow: 0 1px 3px rgba(0,0,0,0.6);'>
-                        <p style='font-size: 1.05rem; line-height: 1.6; margin-bottom: 0.5rem;'>{row['text']}</p>
-                        <p style='font-size: 0.9rem; color: #6d4c41; font-style: italic;'>({book_display} {row['chapter']}:{row['verse']})</p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+            logger.info("Rendered translated input.")
+
+        if not recommendations.empty:
+            st.markdown(_RECOMMENDED_HEADING_HTML[lang], unsafe_allow_html=True)
+            # Book display names are precomputed when the corpus is loaded
+            references = (
+                recommendations["book_display"] + " "
+                + recommendations["chapter"].astype(str) + ":"
+                + recommendations["verse"].astype(str)
+            )
+
+            # Build every verse card first and send them in a single markdown call
+            html_parts = [
+                _VERSE_CARD_TMPL.format(text=text, reference=reference)
+                for text, reference in zip(recommendations["text"].to_numpy(), references.to_numpy())
+            ]
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
             logger.info(f"Rendered {len(recommendations)} recommended verses.")
         else:
-            st.markdown(
-                f"<p style='color: #6d4c41; font-style: italic;'>"
-                f"{'No se encontraron coincidencias.' if lang == 'es' else 'No matches found.'}</p>",
-                unsafe_allow_html=True
-            )
+            st.markdown(_NO_MATCHES_HTML[lang], unsafe_allow_html=True)
             logger.info("No verse recommendations found for this analysis.")
 
     except Exception as e:
         logger.error(f"Error rendering analysis results: {e}")
         st.error("An error occurred while displaying analysis results.")
 
+@st.fragment
 def render_feedback_section_final(
     user_name: str,
     user_input: str,
@@ -700,6 +1052,8 @@ def render_feedback_section_final(
 ) -> None:
     """
     Render the feedback block and the external feedback form link.
+    Runs as a fragment, so the 👍/👎 buttons rerun only this block and the
+    analysis results above stay on screen without a full-app rerun.
 
     Args:
         user_name (str): Name of the user.
@@ -712,19 +1066,7 @@ def render_feedback_section_final(
     try:
         render_feedback_section(user_name, user_input, recommendations, emotion, theme, lang)
 
-        form_url = "https://forms.gle/ATXVWXTaoCDR19rf9"
-        label = "📋 Sería de gran ayuda conocer su opinión:" if lang == "es" else "📋 Would you like to give us more detailed feedback?"
-        button_text = "Ir al formulario del feedback" if lang == "es" else "Open feedback form"
-
-        st.markdown(
-            f"""
-            <div style='text-align: center; margin-top: 2.5rem;'>
-                <p style='font-size: 1.15rem;'>{label}</p>
-                <a href="{form_url}" target="_blank" class="feedback-button">{button_text}</a>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(_FEEDBACK_FORM_HTML[lang], unsafe_allow_html=True)
         logger.info("Rendered feedback section and feedback form link.")
     except Exception as e:
         logger.error(f"Error rendering feedback section: {e}")
@@ -737,15 +1079,14 @@ def main():
     Handles user workflow: input, analysis, rendering, recommendations, and feedback.
     """
     log_memory_usage("Start of main")
-    image_path = Path(__file__).parent / "assets" / "old-wrinkled-paper.jpg"
-    set_background(str(image_path))
+    _start_cache_warmup()
     inject_custom_styles()
 
     lang, T = render_language_selector()
     submit_text = T["submit_button"]
 
     with st.form(key="input_form"):
-        user_name, user_input = render_user_inputs(T)
+        user_name, user_input = render_user_inputs(lang)
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
             submit = st.form_submit_button(submit_text)
@@ -754,7 +1095,18 @@ def main():
         if not validate_user_input(user_input, lang):
             st.stop()
 
-        emotion, theme, translated, recommendations = analyze_user_input(user_input, lang)
+        # Resubmitting the same text in the same language reuses the previous analysis
+        analysis_key = (normalize_text(user_input), lang)
+        if analysis_key == st.session_state.get("_last_key") and st.session_state.get("analysis_ready"):
+            emotion = st.session_state.emotion
+            theme = st.session_state.theme
+            translated = st.session_state["_last_translated"]
+            recommendations = st.session_state.recommendations
+            logger.info("Input unchanged since last analysis; reusing previous results.")
+        else:
+            emotion, theme, translated, recommendations = analyze_user_input(user_input, lang)
+            st.session_state["_last_key"] = analysis_key
+            st.session_state["_last_translated"] = translated
         render_analysis_results(T, user_input, translated, emotion, theme, recommendations, lang)
         log_memory_usage("After render_analysis_results")
         st.session_state.analysis_ready = True
@@ -777,43 +1129,7 @@ def main():
         )
 
     # === Footer ===
-    st.markdown("""
-        <style>
-        .custom-footer {
-            position: fixed;
-            bottom: 0;
-            width: 28%;
-            background-color: rgba(243, 229, 209, 0.85);
-            color: #4e342e;
-            text-align: center;
-            font-size: 1rem;
-            padding: 0.6rem 1rem;
-            font-family: 'Merriweather', serif;
-            border-top: 1px solid #5d4037;
-            border-radius: 10px 10px 0 0;
-            box-shadow: 0px -2px 12px rgba(0, 0, 0, 0.5);
-            z-index: 9999;
-        }
-        .custom-footer a {
-            color: #6d4c41;
-            text-decoration: none;
-            font-weight: 500;
-            display: inline-block;
-            position: relative; 
-            transition: all 0.25s ease
-        }
-                
-        .custom-footer a:hover {
-            transform: scale(1.05);
-            filter: drop-shadow(0 0 4px rgba(255,255,255,0.4)) brightness(1.2);
-            text-shadow: 0 0 2px rgba(255, 255, 255, 0.2);
-        }
-        </style>
-
-        <div class="custom-footer">
-            Hecho con ❤️ por Manuel Cruz Rodríguez · <a href="https://www.linkedin.com/in/mancrurod/" target="_blank">🌐 LinkedIn</a>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
     logger.info("App session ended.")
 
 
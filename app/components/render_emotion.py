@@ -1,50 +1,36 @@
 # app/components/render_emotion.py
 
-def render_emotion_block(st, label: str, score: float, lang: str = "en"):
-    EMOTION_COLORS = {
-        "joy": "#d4af37",
-        "sadness": "#90caf9",
-        "anger": "#ef5350",
-        "fear": "#e57373",
-        "surprise": "#ce93d8",
-        "neutral": "#e0e0e0",
-        "disgust": "#c5e1a5"
-    }
-
-    EMOTION_ICONS = {
-        "joy": "🌟",
-        "sadness": "😔",
-        "anger": "😡",
-        "fear": "😱",
-        "surprise": "😮",
-        "neutral": "⚪",
-        "disgust": "🤮"
-    }
+EMOTION_COLORS = {
+    "joy": "#d4af37",
+    "sadness": "#90caf9",
+    "anger": "#ef5350",
+    "fear": "#e57373",
+    "surprise": "#ce93d8",
+    "neutral": "#e0e0e0",
+    "disgust": "#c5e1a5"
+}
 
-    EMOTION_TRANSLATIONS = {
-        "joy": "Alegría",
-        "sadness": "Tristeza",
-        "anger": "Ira",
-        "fear": "Miedo",
-        "surprise": "Sorpresa",
-        "neutral": "Neutral",
-        "disgust": "Asco"
-    }
+EMOTION_ICONS = {
+    "joy": "🌟",
+    "sadness": "😔",
+    "anger": "😡",
+    "fear": "😱",
+    "surprise": "😮",
+    "neutral": "⚪",
+    "disgust": "🤮"
+}
 
-    label_lc = label.lower()
-    color = EMOTION_COLORS.get(label_lc, "#eeeeee")
-    icon = EMOTION_ICONS.get(label_lc, "❓")
-    # Fallback: si no está la traducción, muestra el label tal cual (en mayúscula)
-    label_translated = EMOTION_TRANSLATIONS.get(label_lc, label.capitalize()) if lang == "es" else label.capitalize()
+EMOTION_TRANSLATIONS = {
+    "joy": "Alegría",
+    "sadness": "Tristeza",
+    "anger": "Ira",
+    "fear": "Miedo",
+    "surprise": "Sorpresa",
+    "neutral": "Neutral",
+    "disgust": "Asco"
+}
 
-    porcentaje = score * 100
-    if lang == "es":
-        porcentaje_str = f"{porcentaje:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-    else:
-        porcentaje_str = f"{porcentaje:.2f}"
-
-    st.markdown(
-        f"""
+_EMOTION_BLOCK_TMPL = """
         <style>
             @keyframes fadeInUp {{
                 from {{
@@ -71,9 +57,25 @@ def render_emotion_block(st, label: str, score: float, lang: str = "en"):
             text-align: center;
         '>
             <h3 style='margin: 0; color: #4e342e; font-weight: 600;'>
-                {icon} {label_translated}: {porcentaje_str}%
+                {icon} {label}: {pct}%
             </h3>
         </div>
-        """,
+        """
+
+def render_emotion_block(st, label: str, score: float, lang: str = "en"):
+    label_lc = label.lower()
+    color = EMOTION_COLORS.get(label_lc, "#eeeeee")
+    icon = EMOTION_ICONS.get(label_lc, "❓")
+    # Fallback: si no está la traducción, muestra el label tal cual (en mayúscula)
+    label_translated = EMOTION_TRANSLATIONS.get(label_lc, label.capitalize()) if lang == "es" else label.capitalize()
+
+    porcentaje = score * 100
+    if lang == "es":
+        porcentaje_str = f"{porcentaje:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    else:
+        porcentaje_str = f"{porcentaje:.2f}"
+
+    st.markdown(
+        _EMOTION_BLOCK_TMPL.format(color=color, icon=icon, label=label_translated, pct=porcentaje_str),
         unsafe_allow_html=True
     )
@@ -1,7 +1,19 @@
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 from src.utils.save_feedback_to_gsheet import save_feedback_to_gsheet
 from texts import TEXTS
 
+# Google Sheets writes run off the script thread; one worker keeps header updates serialized
+_FEEDBACK_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feedback")
+atexit.register(_FEEDBACK_EXECUTOR.shutdown, wait=True)
+
+def _set_feedback_value(value):
+    """
+    Button callback: runs before the rerun, so the new value is seen without an extra st.rerun().
+    """
+    st.session_state.feedback_value = value
+
 def render_feedback_section(usuario, user_input, recommendations, top_emotion, theme_result, language):
     """
     Displays a one-time feedback section with clean state management.
@@ -43,8 +55,10 @@ def render_feedback_section(usuario, user_input, recommendations, top_emotion, t
         for i, verse in enumerate(verses_list):
             feedback_data[f"versiculo_{i+1}"] = verse
 
-        # Save feedback data to Google Sheet
-        save_feedback_to_gsheet(feedback_data)
+        # Save feedback data to Google Sheet in the background so the thank-you shows immediately.
+        # Saving is best-effort: the worker has no Streamlit context, so a failed save is only
+        # logged (logs/feedback_logs) and the user still sees the thank-you message.
+        _FEEDBACK_EXECUTOR.submit(save_feedback_to_gsheet, feedback_data)
 
         # Update session state to indicate feedback has been sent and submitted
         st.session_state.feedback_sent = True
@@ -70,11 +84,7 @@ def render_feedback_section(usuario, user_input, recommendations, top_emotion, t
     st.markdown(f"<h4 style='text-align: center;'>{T['feedback_question']}</h4>", unsafe_allow_html=True)
     col1, col2, col3, col4 = st.columns([2, 1, 1, 2])
     with col2:
-        if st.button("👍"):
-            st.session_state.feedback_value = "like"
-            st.rerun()
+        st.button("👍", on_click=_set_feedback_value, args=("like",))
     with col3:
-        if st.button("👎"):
-            st.session_state.feedback_value = "dislike"
-            st.rerun()
+        st.button("👎", on_click=_set_feedback_value, args=("dislike",))
 
@@ -1,50 +1,33 @@
 # app/components/render_theme.py
 
-def render_theme_block(st, label: str, score: float, lang: str = "en"):
-    THEME_COLORS = {
-        "love": "#f48fb1",
-        "faith": "#a5d6a7",
-        "hope": "#90caf9",
-        "forgiveness": "#ffcc80",
-        "fear": "#e57373"
-    }
-
-    THEME_ICONS = {
-        "love": "💗",
-        "faith": "🙏",
-        "hope": "🌈",
-        "forgiveness": "🕊️",
-        "fear": "😨"
-    }
-
-    THEME_TRANSLATIONS = {
-        "love": "Amor",
-        "faith": "Fe",
-        "hope": "Esperanza",
-        "forgiveness": "Perdón",
-        "fear": "Miedo"
-    }
+THEME_COLORS = {
+    "love": "#f48fb1",
+    "faith": "#a5d6a7",
+    "hope": "#90caf9",
+    "forgiveness": "#ffcc80",
+    "fear": "#e57373"
+}
 
-    # Inverse translation in case label is already in Spanish
-    INV_THEME_TRANSLATIONS = {v.lower(): k for k, v in THEME_TRANSLATIONS.items()}
-
-    label_lc = label.lower().strip()
+THEME_ICONS = {
+    "love": "💗",
+    "faith": "🙏",
+    "hope": "🌈",
+    "forgiveness": "🕊️",
+    "fear": "😨"
+}
 
-    # Ensure we're always working with English internally
-    label_en = INV_THEME_TRANSLATIONS.get(label_lc, label_lc)
-
-    color = THEME_COLORS.get(label_en, "#eeeeee")
-    icon = THEME_ICONS.get(label_en, "")
-    label_translated = THEME_TRANSLATIONS[label_en] if lang == "es" else label_en.capitalize()
+THEME_TRANSLATIONS = {
+    "love": "Amor",
+    "faith": "Fe",
+    "hope": "Esperanza",
+    "forgiveness": "Perdón",
+    "fear": "Miedo"
+}
 
-    porcentaje = score * 100
-    if lang == "es":
-        porcentaje_str = f"{porcentaje:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-    else:
-        porcentaje_str = f"{porcentaje:.2f}"
+# Inverse translation in case label is already in Spanish
+INV_THEME_TRANSLATIONS = {v.lower(): k for k, v in THEME_TRANSLATIONS.items()}
 
-    st.markdown(
-        f"""
+_THEME_BLOCK_TMPL = """
         <style>
             @keyframes fadeInUp {{
                 from {{
@@ -71,10 +54,28 @@ def render_theme_block(st, label: str, score: float, lang: str = "en"):
             text-align: center;
         '>
             <h3 style='margin: 0; color: #4e342e; font-weight: 600;'>
-                {icon} {label_translated}: {porcentaje_str}%
+                {icon} {label}: {pct}%
             </h3>
         </div>
-        """,
+        """
+
+def render_theme_block(st, label: str, score: float, lang: str = "en"):
+    label_lc = label.lower().strip()
+
+    # Ensure we're always working with English internally
+    label_en = INV_THEME_TRANSLATIONS.get(label_lc, label_lc)
+
+    color = THEME_COLORS.get(label_en, "#eeeeee")
+    icon = THEME_ICONS.get(label_en, "")
+    label_translated = THEME_TRANSLATIONS[label_en] if lang == "es" else label_en.capitalize()
+
+    porcentaje = score * 100
+    if lang == "es":
+        porcentaje_str = f"{porcentaje:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    else:
+        porcentaje_str = f"{porcentaje:.2f}"
+
+    st.markdown(
+        _THEME_BLOCK_TMPL.format(color=color, icon=icon, label=label_translated, pct=porcentaje_str),
         unsafe_allow_html=True
     )
-
@@ -18,6 +18,16 @@ TEXTS = {
         "mental_health_note": "Si te sientes mal a menudo, recuerda que es bueno cuidar tu salud mental y un/a psicólogo/a siempre podrá ayudarte. ❤️‍🩹",
         "submit_button": "🧬 Analizar",
         "language_label": "Elegir idioma",
+        "analyzing": "Analizando...",
+        "recommended_verses": "Versículos recomendados",
+        "no_matches": "No se encontraron coincidencias.",
+        "feedback_form_label": "📋 Sería de gran ayuda conocer su opinión:",
+        "feedback_form_button": "Ir al formulario del feedback",
+        "warn_short": "⚠️ Por favor, escribe un poco más de contexto.",
+        "err_emotion": "❌ No se pudo analizar la emoción del texto.",
+        "err_theme": "❌ No se pudo detectar el tema principal.",
+        "err_corpus": "⚠️ No se pudo cargar el corpus de versículos.",
+        "err_unexpected": "❌ Ha ocurrido un error inesperado durante el análisis.",
         },
     "en": {
         "subtitle": "How do you feel? Tell me and I will show you verses that will try to help you feel understood.",
@@ -32,6 +42,16 @@ TEXTS = {
         "mental_health_note": "If you often feel unwell, remember that it's good to take care of your mental health. A psychologist will always help you. ❤️‍🩹",
         "submit_button": "🧬 Analyze",
         "language_label": "Choose language",
+        "analyzing": "Analyzing...",
+        "recommended_verses": "Recommended verses",
+        "no_matches": "No matches found.",
+        "feedback_form_label": "📋 Would you like to give us more detailed feedback?",
+        "feedback_form_button": "Open feedback form",
+        "warn_short": "⚠️ Please write a bit more context.",
+        "err_emotion": "❌ Failed to analyze emotion from text.",
+        "err_theme": "❌ Failed to detect the main theme.",
+        "err_corpus": "⚠️ Verse corpus could not be loaded.",
+        "err_unexpected": "❌ An unexpected error occurred during analysis.",
     }
 }
 
@@ -11,8 +11,7 @@ Designed for integration with Streamlit and use in production environments.
 
 from pathlib import Path
 import pandas as pd
-from typing import List, Literal
-from src.utils.translation_maps import EMOTION_MAP, THEME_MAP
+from src.utils.translation_maps import BOOK_NAME_MAP_ES, EMOTION_MAP, THEME_MAP
 import streamlit as st
 import unidecode
 import logging
@@ -53,6 +52,10 @@ LOGGER = setup_logger(LOG_DIR / "recommender.log", level=logging.INFO)
 
 CORPUS_PATH = Path("data/labeled/bible_kjv/emotion_theme")
 MAX_RESULTS = 5
+# Columns read from the labeled CSVs; scraping metadata (id, subtitle, source_url) is never used here
+CORPUS_COLUMNS = ["book", "chapter", "verse", "text", "verse_id", "theme", "emotion"]
+# Low-cardinality label columns are stored as categoricals
+CATEGORY_COLUMNS = ["book", "theme", "emotion"]
 
 # ==============================
 # === NORMALIZATION UTILS ======
@@ -74,21 +77,61 @@ def normalize(s: str, logger: logging.Logger = None) -> str:
             logger.error(f"Normalization error for input: {s} — {e}")
         return ""
 
+def normalize_column(values: pd.Series, logger: logging.Logger = None) -> pd.Series:
+    """
+    Vectorized normalize(): each distinct value is normalized once and mapped back.
+    Args:
+        values (pd.Series): Column to normalize.
+        logger (logging.Logger, optional): Logger for any normalization issue.
+    Returns:
+        pd.Series: Normalized values, aligned with the input index.
+    """
+    return values.map({v: normalize(v, logger=logger) for v in values.unique()})
+
+def _normalized(df: pd.DataFrame, column: str, logger: logging.Logger = None) -> pd.Series:
+    """
+    Return the normalized values of `column`, using the precomputed `<column>_norm` column when present.
+    """
+    precomputed = f"{column}_norm"
+    if precomputed in df.columns:
+        return df[precomputed]
+    return normalize_column(df[column], logger=logger)
+
+def format_book_display(books: pd.Series, lang: str = "en") -> pd.Series:
+    """
+    Build human-readable book names from corpus book ids (vectorized).
+
+    Args:
+        books (pd.Series): Book ids as stored in the corpus (e.g. "1_corinthians", "1-corintios").
+        lang (str): Language code ("en" or "es").
+
+    Returns:
+        pd.Series: Display names, e.g. "1 Corinthians" or "1 Corintios".
+    """
+    book_key = books.str.lower().str.replace("_", "-", regex=False)
+    if lang == "es":
+        return book_key.map(BOOK_NAME_MAP_ES).fillna(book_key.str.title())
+    return book_key.str.replace("-", " ", regex=False).str.title()
+
 # ==============================
 # === LOAD CORPUS ==============
 # ==============================
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def load_entire_corpus(lang: str = "en", logger: logging.Logger = LOGGER) -> pd.DataFrame:
     """
     Load the entire labeled corpus for the selected language.
 
+    The DataFrame is cached once per process and shared across sessions without
+    copying or re-hashing, so callers must treat it as read-only.
+
     Args:
         lang (str): Language code ("en" or "es")
         logger (logging.Logger): Logger for error reporting.
 
     Returns:
-        pd.DataFrame: Combined dataframe with all labeled verses
+        pd.DataFrame: Combined dataframe with all labeled verses, plus "book_display"
+            and normalized "book_norm", "emotion_norm" and "theme_norm" columns
     """
     base_path = Path("data/labeled")
     corpus_dir = base_path / ("bible_kjv" if lang == "en" else "bible_rv60") / "emotion_theme"
@@ -102,8 +145,7 @@ def load_entire_corpus(lang: str = "en", logger: logging.Logger = LOGGER) -> pd.
     dfs = []
     for file in all_files:
         try:
-            df = pd.read_csv(file)
-            df["source_file"] = file.stem  # Optional: to keep track of origin
+            df = pd.read_csv(file, engine="pyarrow", usecols=CORPUS_COLUMNS)  # multithreaded C++ parser
             dfs.append(df)
         except Exception as e:
             logger.error(f"Error loading {file.name}: {e}")
@@ -115,6 +157,12 @@ def load_entire_corpus(lang: str = "en", logger: logging.Logger = LOGGER) -> pd.
         return pd.DataFrame()
 
     combined = pd.concat(dfs, ignore_index=True)
+    # Converted after concat so all files share one set of categories
+    combined = combined.astype({column: "category" for column in CATEGORY_COLUMNS})
+    # Display names and normalized match keys are computed once here instead of per request
+    combined["book_display"] = format_book_display(combined["book"], lang=lang)
+    for column in ("book", "emotion", "theme"):
+        combined[f"{column}_norm"] = normalize_column(combined[column], logger=logger)
     logger.info(f"Corpus loaded for language '{lang}': {len(combined)} verses from {len(dfs)} files.")
     return combined
 
@@ -159,8 +207,8 @@ def recommend_verses(
     theme_norm = normalize(theme, logger=logger)
 
     df_filtered = df[
-        (df["emotion"].apply(lambda x: normalize(x, logger=logger)) == emotion_norm) &
-        (df["theme"].apply(lambda x: normalize(x, logger=logger)).str.contains(theme_norm))
+        (_normalized(df, "emotion", logger=logger) == emotion_norm) &
+        (_normalized(df, "theme", logger=logger).str.contains(theme_norm))
     ]
 
     if df_filtered.empty:
@@ -179,16 +227,15 @@ def recommend_verses(
         st.warning("Error generating recommendations. Please try again.")
         return pd.DataFrame()
 
-def recommend_verses_by_sections(
+def split_verses_by_sections(
     df: pd.DataFrame,
     emotion: str,
     theme: str,
     lang: str = "en",
     logger: logging.Logger = LOGGER
-) -> pd.DataFrame:
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
-    Recommend 2 verses from the Gospels, 2 from the rest of the NT, and 2 from the OT,
-    matching the emotion and theme robustly (with normalization and logging).
+    Filter verses by emotion and theme and split the matches into Gospels, rest of the NT, and OT.
 
     Args:
         df (pd.DataFrame): DataFrame with all annotated verses.
@@ -198,13 +245,8 @@ def recommend_verses_by_sections(
         logger (logging.Logger): Logger for reporting.
 
     Returns:
-        pd.DataFrame: 6 recommended verses (up to 2 from each section).
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: Matching verses as (gospels, nt_rest, ot).
     """
-    if df.empty:
-        logger.warning("Attempted to recommend verses by sections from an empty DataFrame.")
-        st.warning("No verses to recommend by sections: corpus is empty.")
-        return pd.DataFrame()
-
     # Define book groups using normalized names
     if lang == "en":
         GOSPELS = ['matthew', 'mark', 'luke', 'john']
@@ -231,19 +273,54 @@ def recommend_verses_by_sections(
     emotion_norm = normalize(emotion, logger=logger)
     theme_norm = normalize(theme, logger=logger)
 
-    df = df.copy()
-    df['book_norm'] = df['book'].apply(lambda x: normalize(x, logger=logger))
-
-    # Filter verses by emotion and theme (normalized)
-    df_filtered = df[
-        (df["emotion"].apply(lambda x: normalize(x, logger=logger)) == emotion_norm) &
-        (df["theme"].apply(lambda x: normalize(x, logger=logger)).str.contains(theme_norm))
-    ]
+    # Filter verses by emotion and theme (normalized; precomputed by load_entire_corpus)
+    mask = (
+        (_normalized(df, "emotion", logger=logger) == emotion_norm) &
+        (_normalized(df, "theme", logger=logger).str.contains(theme_norm))
+    )
+    df_filtered = df[mask]
+    book_norm = _normalized(df, "book", logger=logger)[mask]
 
     # Sections
-    gospels = df_filtered[df_filtered["book_norm"].isin(GOSPELS)]
-    nt_rest = df_filtered[df_filtered["book_norm"].isin(NT_REST)]
-    ot = df_filtered[~df_filtered["book_norm"].isin(ALL_NT)]
+    gospels = df_filtered[book_norm.isin(GOSPELS)]
+    nt_rest = df_filtered[book_norm.isin(NT_REST)]
+    ot = df_filtered[~book_norm.isin(ALL_NT)]
+    return gospels, nt_rest, ot
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def load_section_pools(lang: str, emotion: str, theme: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Section pools of the cached corpus for one (lang, emotion, theme) combination.
+
+    There are only a few dozen label combinations, so the corpus is filtered once per
+    combination per process; sampling still happens on every request. Like
+    load_entire_corpus, the result is shared and must be treated as read-only.
+
+    Args:
+        lang (str): Language code ("en" or "es").
+        emotion (str): Detected emotion.
+        theme (str): Detected theme.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: Matching verses as (gospels, nt_rest, ot).
+    """
+    return split_verses_by_sections(load_entire_corpus(lang=lang), emotion, theme, lang=lang)
+
+def sample_verses_by_sections(
+    pools: tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+    logger: logging.Logger = LOGGER
+) -> pd.DataFrame:
+    """
+    Sample up to 2 verses from each section pool and shuffle them together.
+
+    Args:
+        pools (tuple): (gospels, nt_rest, ot) as returned by split_verses_by_sections.
+        logger (logging.Logger): Logger for reporting.
+
+    Returns:
+        pd.DataFrame: Up to 6 recommended verses.
+    """
+    gospels, nt_rest, ot = pools
 
     # Helper for safe sampling with logging
     def safe_sample(section_df, n, section_name):
@@ -267,8 +344,39 @@ def recommend_verses_by_sections(
     result = pd.concat([sample_gospels, sample_nt_rest, sample_ot], ignore_index=True)
     if not result.empty:
         result = result.sample(frac=1, random_state=42).reset_index(drop=True)
+    return result
+
+def recommend_verses_by_sections(
+    df: pd.DataFrame,
+    emotion: str,
+    theme: str,
+    lang: str = "en",
+    logger: logging.Logger = LOGGER
+) -> pd.DataFrame:
+    """
+    Recommend 2 verses from the Gospels, 2 from the rest of the NT, and 2 from the OT,
+    matching the emotion and theme robustly (with normalization and logging).
+
+    Args:
+        df (pd.DataFrame): DataFrame with all annotated verses.
+        emotion (str): Detected emotion.
+        theme (str): Detected theme.
+        lang (str): Language ("en" or "es").
+        logger (logging.Logger): Logger for reporting.
+
+    Returns:
+        pd.DataFrame: 6 recommended verses (up to 2 from each section).
+    """
+    if df.empty:
+        logger.warning("Attempted to recommend verses by sections from an empty DataFrame.")
+        st.warning("No verses to recommend by sections: corpus is empty.")
+        return pd.DataFrame()
+
+    pools = split_verses_by_sections(df, emotion, theme, lang=lang, logger=logger)
+    result = sample_verses_by_sections(pools, logger=logger)
+    if not result.empty:
         logger.info(f"Recommended {len(result)} verse(s) by section for emotion='{emotion}', theme='{theme}', lang='{lang}'.")
     else:
         logger.info(f"No verses found in any section for emotion='{emotion}' and theme='{theme}'.")
 
-    return result
\ No newline at end of file
+    return result
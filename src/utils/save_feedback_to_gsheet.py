@@ -1,9 +1,57 @@
 from datetime import datetime
+import logging
+from pathlib import Path
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import streamlit as st
 
-def save_feedback_to_gsheet(feedback_data: dict):
+def setup_logger(log_path: Path, level: int = logging.INFO, log_name: str = "feedback_logger") -> logging.Logger:
+    """
+    Set up a file logger for feedback saving.
+    Saves run on a background thread, where Streamlit messages are not shown, so the log is the failure record.
+    """
+    logger = logging.getLogger(log_name)
+    logger.setLevel(level)
+    if not logger.handlers:
+        fh = logging.FileHandler(log_path, encoding="utf-8")
+        fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        logger.addHandler(fh)
+    return logger
+
+LOG_DIR = Path("logs/feedback_logs")
+LOG_DIR.mkdir(parents=True, exist_ok=True)
+LOGGER = setup_logger(LOG_DIR / "feedback.log")
+
+@st.cache_resource(show_spinner=False)
+def _get_worksheet() -> gspread.Worksheet:
+    """
+    Authorize against Google Sheets and open the feedback worksheet.
+    Cached per process so the OAuth handshake only happens on the first submit.
+
+    Returns:
+        gspread.Worksheet: First worksheet of the spreadsheet configured in secrets.
+    """
+    scope = [
+        "https://spreadsheets.google.com/feeds",
+        "https://www.googleapis.com/auth/drive"
+    ]
+
+    creds_dict = {
+        "type": st.secrets["google"]["type"],
+        "project_id": st.secrets["google"]["project_id"],
+        "private_key_id": st.secrets["google"]["private_key_id"],
+        "private_key": st.secrets["google"]["private_key"].replace("\\n", "\n"),
+        "client_email": st.secrets["google"]["client_email"],
+        "client_id": st.secrets["google"]["client_id"],
+        "token_uri": st.secrets["google"]["token_uri"],
+    }
+
+    credentials = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
+    client = gspread.authorize(credentials)
+    sheet = client.open_by_url(st.secrets["spreadsheet"]["url"])
+    return sheet.get_worksheet(0)
+
+def save_feedback_to_gsheet(feedback_data: dict) -> bool:
     """
     Safely saves user feedback data to a Google Sheet, never deleting previous rows.
     If the header changes, missing columns are appended at the end; old data is preserved.
@@ -14,28 +62,12 @@ def save_feedback_to_gsheet(feedback_data: dict):
                 - usuario, texto, emocion, emocion_pct, tema, tema_pct, feedback
             Optionally:
                 - versiculo_1, versiculo_2, ..., versiculo_n
+
+    Returns:
+        bool: True if the row was appended, False if saving failed (the error is logged).
     """
     try:
-        # === Google Sheets setup ===
-        scope = [
-            "https://spreadsheets.google.com/feeds",
-            "https://www.googleapis.com/auth/drive"
-        ]
-
-        creds_dict = {
-            "type": st.secrets["google"]["type"],
-            "project_id": st.secrets["google"]["project_id"],
-            "private_key_id": st.secrets["google"]["private_key_id"],
-            "private_key": st.secrets["google"]["private_key"].replace("\\n", "\n"),
-            "client_email": st.secrets["google"]["client_email"],
-            "client_id": st.secrets["google"]["client_id"],
-            "token_uri": st.secrets["google"]["token_uri"],
-        }
-
-        credentials = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
-        client = gspread.authorize(credentials)
-        sheet = client.open_by_url(st.secrets["spreadsheet"]["url"])
-        worksheet = sheet.get_worksheet(0)
+        worksheet = _get_worksheet()
 
         # === Define base fields and dynamic versiculo_* fields ===
         fixed_fields = ["usuario", "texto", "emocion", "emocion_pct", "tema", "tema_pct", "feedback"]
@@ -47,11 +79,8 @@ def save_feedback_to_gsheet(feedback_data: dict):
 
         # === Prepare header (timestamp always first) ===
         desired_header = ["timestamp"] + all_fields
-        existing_values = worksheet.get_all_values()
-        if existing_values:
-            current_header = existing_values[0]
-        else:
-            current_header = []
+        # Only the header row is needed; reading the whole sheet grows with every submission
+        current_header = worksheet.row_values(1)
 
         # === If header is empty, write it ===
         if not current_header:
@@ -78,6 +107,9 @@ def save_feedback_to_gsheet(feedback_data: dict):
         # === Append new feedback ===
         worksheet.append_row(row, value_input_option="USER_ENTERED")
 
-    except Exception as e:
-        st.error("❌ Failed to save feedback to Google Sheets.")
-        st.exception(e)
+        LOGGER.info("Feedback saved to Google Sheets.")
+        return True
+
+    except Exception:
+        LOGGER.exception("Failed to save feedback to Google Sheets.")
+        return False
@@ -7,6 +7,9 @@ ensuring correct matching and filtering by emotion and theme.
 Covers:
 - Text normalization (normalize)
 - Verse recommendation by emotion/theme (recommend_verses)
+- Book display names (format_book_display)
+- Vectorized normalization and precomputed match keys (normalize_column)
+- Section pools and per-section sampling (split_verses_by_sections, sample_verses_by_sections)
 - Edge cases: empty corpus, no matches, robust filtering
 
 Usage:
@@ -20,7 +23,11 @@ import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-from src.interface.recommender import normalize, recommend_verses
+import numpy as np
+from src.interface.recommender import (
+    format_book_display, normalize, normalize_column, recommend_verses,
+    sample_verses_by_sections, split_verses_by_sections
+)
 
 class DummyLogger:
     def warning(self, *args, **kwargs): pass
@@ -88,3 +95,71 @@ def test_recommend_verses_spanish_mapping(monkeypatch):
     assert not recs.empty
     assert (recs["verse_id"] == "Juan_3_16").any()
 
+
+def test_format_book_display_english():
+    books = pd.Series(["john", "1_corinthians", "song_of_solomon"])
+    assert format_book_display(books, lang="en").tolist() == ["John", "1 Corinthians", "Song Of Solomon"]
+
+def test_format_book_display_spanish_mapping_and_fallback():
+    books = pd.Series(["1-corintios", "genesis", "libro-desconocido"])
+    # Mapped names keep their accents; unknown ids fall back to title case
+    assert format_book_display(books, lang="es").tolist() == ["1 Corintios", "Génesis", "Libro-Desconocido"]
+
+def test_normalize_column_matches_normalize():
+    values = pd.Series([" Jesús ", "FAITH", None, "Éxodo", "FAITH"])
+    assert normalize_column(values).tolist() == [normalize(v) for v in values]
+
+def test_recommend_verses_uses_precomputed_norm_columns():
+    df = pd.DataFrame({
+        "book": ["John"],
+        "emotion": ["Joy"],
+        "theme": ["Love"],
+        "emotion_norm": ["joy"],
+        "theme_norm": ["love;faith"],
+        "verse_id": ["John_3_16"],
+        "text": ["For God so loved the world..."]
+    })
+    recs = recommend_verses(
+        df, emotion="joy", theme="faith", lang="en", max_results=1, logger=DummyLogger()
+    )
+    # "faith" only appears in the precomputed theme_norm column
+    assert (recs["verse_id"] == "John_3_16").any()
+
+def test_split_verses_by_sections():
+    df = pd.DataFrame({
+        "book": ["john", "romans", "psalms", "mark", "genesis"],
+        "emotion": ["joy", "joy", "joy", "sadness", "joy"],
+        "theme": ["love", "love", "love;hope", "love", "faith"],
+        "verse_id": ["John_3_16", "Romans_8_28", "Psalms_23_1", "Mark_1_1", "Genesis_1_1"],
+        "text": ["a", "b", "c", "d", "e"]
+    })
+    gospels, nt_rest, ot = split_verses_by_sections(df, "joy", "love", lang="en", logger=DummyLogger())
+    assert gospels["verse_id"].tolist() == ["John_3_16"]
+    assert nt_rest["verse_id"].tolist() == ["Romans_8_28"]
+    assert ot["verse_id"].tolist() == ["Psalms_23_1"]
+
+def test_split_verses_by_sections_categorical_corpus():
+    # Same shape as load_entire_corpus output: categorical columns, NaN themes, precomputed *_norm keys
+    df = pd.DataFrame({
+        "book": ["john", "romans", "psalms", "mark", "genesis", "luke"],
+        "emotion": ["joy", "joy", "joy", "sadness", "joy", "joy"],
+        "theme": ["love", "love", "love;hope", "love", "faith", np.nan],
+        "verse_id": ["John_3_16", "Romans_8_28", "Psalms_23_1", "Mark_1_1", "Genesis_1_1", "Luke_1_1"],
+        "text": ["a", "b", "c", "d", "e", "f"]
+    }).astype({"book": "category", "theme": "category", "emotion": "category"})
+    for column in ("book", "emotion", "theme"):
+        df[f"{column}_norm"] = normalize_column(df[column])
+    gospels, nt_rest, ot = split_verses_by_sections(df, "joy", "love", lang="en", logger=DummyLogger())
+    assert gospels["verse_id"].tolist() == ["John_3_16"]
+    assert nt_rest["verse_id"].tolist() == ["Romans_8_28"]
+    assert ot["verse_id"].tolist() == ["Psalms_23_1"]
+
+def test_sample_verses_by_sections_takes_up_to_two_per_section():
+    gospels = pd.DataFrame({"verse_id": ["G1", "G2", "G3"]})
+    nt_rest = pd.DataFrame({"verse_id": ["N1"]})
+    ot = pd.DataFrame({"verse_id": []})
+    recs = sample_verses_by_sections((gospels, nt_rest, ot), logger=DummyLogger())
+    ids = set(recs["verse_id"])
+    assert len(recs) == 3
+    assert "N1" in ids
+    assert len(ids & {"G1", "G2", "G3"}) == 2